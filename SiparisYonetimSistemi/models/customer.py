@@ -10,6 +10,11 @@ class Customer:
     Müşteri sınıfı. Sistemdeki müşterileri temsil eder.
     """
     
+    __slots__ = (
+        '__customer_id', '__name', '__email', '__address', '__phone',
+        '__order_history', '__order_index',
+    )
+    
     def __init__(self, customer_id, name, email, address, phone=None):
         """
         Müşteri nesnesi oluşturur.
@@ -27,6 +32,7 @@ class Customer:
         self.__address = address
         self.__phone = phone
         self.__order_history = []  # Sipariş geçmişi listesi
+        self.__order_index = {}  # Sipariş ID'si -> Sipariş nesnesi eşleşmesi
     
     @property
     def customer_id(self):
@@ -89,6 +95,7 @@ class Customer:
             order: Sipariş nesnesi
         """
         self.__order_history.append(order)
+        self.__order_index[order.order_id] = order
     
     def get_order_by_id(self, order_id):
         """
@@ -100,10 +107,7 @@ class Customer:
         Returns:
             Order or None: Sipariş bulunursa sipariş nesnesi, bulunamazsa None
         """
-        for order in self.__order_history:
-            if order.order_id == order_id:
-                return order
-        return None
+        return self.__order_index.get(order_id)
     
     def __str__(self):
         """String temsili"""
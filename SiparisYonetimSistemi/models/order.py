@@ -7,7 +7,11 @@ Sipariş ile ilgili sınıfları içerir
 
 from enum import Enum
 from datetime import datetime
-import uuid
+from os import urandom
+
+# __str__ metotlarında kullanılan hazır biçim şablonları
+_ORDER_ITEM_STR = "{} x {} ({} TL/adet)".format
+_ORDER_STR = "Sipariş #{} ({}) - {} ürün, Toplam: {} TL".format
 
 class OrderStatus(Enum):
     """Sipariş durumlarını tanımlayan enum sınıfı"""
@@ -22,6 +26,8 @@ class OrderItem:
     Sipariş öğesi sınıfı. Bir siparişte yer alan belirli bir ürünü ve miktarını temsil eder.
     """
     
+    __slots__ = ('__product', '__quantity', '__item_price')
+    
     def __init__(self, product, quantity):
         """
         Sipariş öğesi oluşturur.
@@ -49,13 +55,22 @@ class OrderItem:
         """Ürün birim fiyatı getter"""
         return self.__item_price
     
+    def _add_quantity(self, quantity):
+        """
+        Aynı ürün tekrar eklendiğinde miktarı artırır.
+        
+        Args:
+            quantity (int): Eklenecek miktar
+        """
+        self.__quantity += quantity
+    
     def get_subtotal(self):
         """Öğenin toplam fiyatını hesaplar"""
         return self.__item_price * self.__quantity
     
     def __str__(self):
         """String temsili"""
-        return f"{self.__product.name} x {self.__quantity} ({self.__item_price} TL/adet)"
+        return _ORDER_ITEM_STR(self.__product.name, self.__quantity, self.__item_price)
 
 
 class Order:
@@ -63,6 +78,12 @@ class Order:
     Sipariş sınıfı. Bir müşterinin yaptığı siparişi temsil eder.
     """
     
+    __slots__ = (
+        '__order_id', '__customer', '__items', '__item_index', '__subtotal',
+        '__item_count', '__status', '__create_date', '__shipping_method',
+        '__shipping_cost', '__delivery_date', '__tracking_number', '__notes',
+    )
+    
     def __init__(self, customer, shipping_method=None):
         """
         Sipariş nesnesi oluşturur.
@@ -71,9 +92,12 @@ class Order:
             customer (Customer): Müşteri nesnesi
             shipping_method (ShippingMethod, optional): Kargo yöntemi
         """
-        self.__order_id = str(uuid.uuid4())[:8].upper()  # Rastgele sipariş ID
+        self.__order_id = urandom(4).hex().upper()  # Rastgele 8 haneli sipariş ID
         self.__customer = customer
         self.__items = []  # Sipariş öğeleri listesi
+        self.__item_index = {}  # Ürün ID'si -> Sipariş öğesi eşleşmesi
+        self.__subtotal = 0  # Öğe eklendikçe/çıkarıldıkça güncellenen ara toplam
+        self.__item_count = 0  # Toplam ürün adedi
         self.__status = OrderStatus.CREATED
         self.__create_date = datetime.now()
         self.__shipping_method = shipping_method
@@ -105,7 +129,7 @@ class Order:
     @status.setter
     def status(self, value):
         """Durum setter"""
-        if not isinstance(value, OrderStatus):
+        if type(value) is not OrderStatus:
             raise ValueError("Durum bir OrderStatus enum değeri olmalıdır")
         self.__status = value
     
@@ -124,7 +148,8 @@ class Order:
         """Kargo yöntemi setter"""
         self.__shipping_method = value
         if value:
-            self.__shipping_cost = value.calculate_cost(self)
+            # Ara toplam ve adet zaten bilindiği için stratejiye aktarılır
+            self.__shipping_cost = value.calculate_cost(self, self.__subtotal, self.__item_count)
     
     @property
     def shipping_cost(self):
@@ -180,13 +205,19 @@ class Order:
             return False
             
         # Ürün zaten siparişteyse miktarını artır
-        for item in self.__items:
-            if item.product.product_id == product.product_id:
-                # Stok düşürüldüğü için miktar güncellemeye gerek kalmadı
-                return True
+        existing = self.__item_index.get(product.product_id)
+        if existing is not None:
+            existing._add_quantity(quantity)
+            self.__subtotal = sum(i.get_subtotal() for i in self.__items)
+            self.__item_count += quantity
+            return True
                 
         # Yeni ürün ekle
-        self.__items.append(OrderItem(product, quantity))
+        item = OrderItem(product, quantity)
+        self.__items.append(item)
+        self.__item_index[product.product_id] = item
+        self.__subtotal += item.get_subtotal()
+        self.__item_count += quantity
         return True
     
     def remove_item(self, product_id):
@@ -199,23 +230,41 @@ class Order:
         Returns:
             bool: İşlem başarılıysa True, değilse False
         """
-        for i, item in enumerate(self.__items):
-            if item.product.product_id == product_id:
-                # Stok miktarını geri ekle
-                item.product.increase_stock(item.quantity)
-                # Öğeyi listeden çıkar
-                self.__items.pop(i)
-                return True
-        return False
+        item = self.__item_index.pop(product_id, None)
+        if item is None:
+            return False
+            
+        # Stok miktarını geri ekle
+        item.product.increase_stock(item.quantity)
+        # Öğeyi listeden çıkar
+        self.__items.remove(item)
+        self.__subtotal = sum(i.get_subtotal() for i in self.__items)
+        self.__item_count -= item.quantity
+        return True
     
     def get_subtotal(self):
         """
-        Siparişin ara toplamını hesaplar (kargo ücreti hariç).
+        Siparişin ara toplamını döndürür (kargo ücreti hariç).
+        Öğe fiyatları sipariş anında sabitlendiği için değer her
+        ekleme/çıkarma işleminde güncel tutulur. Yeni satır eklenirken
+        toplam artırılır; mevcut satır değiştiğinde veya satır
+        çıkarıldığında ise satır ara toplamları yeniden toplanır, çünkü
+        ondalıklı fiyatlarda fark ekleyip çıkarmak yuvarlama hatası bırakır.
+        Böylece değer her zaman satır ara toplamlarının toplamına eşittir.
         
         Returns:
             float: Sipariş ara toplamı
         """
-        return sum(item.get_subtotal() for item in self.__items)
+        return self.__subtotal
+    
+    def get_total_quantity(self):
+        """
+        Siparişteki toplam ürün adedini döndürür.
+        
+        Returns:
+            int: Toplam ürün adedi
+        """
+        return self.__item_count
     
     def get_total(self):
         """
@@ -228,7 +277,4 @@ class Order:
     
     def __str__(self):
         """String temsili"""
-        status_text = self.__status.value
-        items_count = len(self.__items)
-        total = self.get_total()
-        return f"Sipariş #{self.__order_id} ({status_text}) - {items_count} ürün, Toplam: {total} TL" 
\ No newline at end of file
+        return _ORDER_STR(self.__order_id, self.__status.value, len(self.__items), self.get_total()) 
\ No newline at end of file
@@ -7,6 +7,9 @@
 
 from enum import Enum
 
+# Product.__str__ için hazır biçim şablonu
+_PRODUCT_STR = "{} ({}) - {} TL [Stok: {}]".format
+
 class ProductCategory(Enum):
     """Ürün kategorilerini tanımlayan enum sınıfı"""
     ELECTRONICS = "Elektronik"
@@ -23,6 +26,8 @@ class Product:
     Ürün sınıfı. Sistem içindeki ürünleri temsil eder.
     """
     
+    __slots__ = ('__product_id', '__name', '__price', '__category', '__stock_quantity')
+    
     def __init__(self, product_id, name, price, category, stock_quantity):
         """
         Ürün nesnesi oluşturur.
@@ -107,4 +112,4 @@ class Product:
     
     def __str__(self):
         """String temsili"""
-        return f"{self.__name} ({self.__category.value}) - {self.__price} TL [Stok: {self.__stock_quantity}]" 
\ No newline at end of file
+        return _PRODUCT_STR(self.__name, self.__category.value, self.__price, self.__stock_quantity) 
\ No newline at end of file
@@ -11,19 +11,27 @@ from datetime import datetime, timedelta
 import random
 import string
 
+_LETTERS = string.ascii_uppercase
+
 class ShippingMethod(ABC):
     """
     Kargo yöntemi için soyut temel sınıf.
     Strategy pattern'deki Strategy arayüzü rolünü üstlenir.
+    
+    Stratejiler durum tutmamalıdır: tüm bilgiyi parametre olarak aldıkları
+    sipariş nesnesinden okurlar. Bu sayede ShippingFactory her sipariş için
+    aynı örneği paylaşabilir.
     """
     
     @abstractmethod
-    def calculate_cost(self, order):
+    def calculate_cost(self, order, subtotal=None, item_count=None):
         """
         Kargo maliyetini hesaplar.
         
         Args:
             order (Order): Sipariş nesnesi
+            subtotal (float, optional): Önceden hesaplanmış ara toplam
+            item_count (int, optional): Önceden hesaplanmış toplam ürün adedi
             
         Returns:
             float: Hesaplanan kargo maliyeti
@@ -50,10 +58,13 @@ class ShippingMethod(ABC):
         Returns:
             str: Oluşturulan takip numarası
         """
-        # 2 harf + 8 rakam şeklinde takip numarası oluştur
-        letters = ''.join(random.choices(string.ascii_uppercase, k=2))
-        numbers = ''.join(random.choices(string.digits, k=8))
-        return f"{letters}{numbers}"
+        # 2 harf + 8 rakam şeklinde takip numarası oluştur.
+        # Tek bir 64 bitlik rastgele sayının üst 24 biti harf çiftini,
+        # alt 40 biti rakamları belirler.
+        bits = random.getrandbits(64)
+        pair = (bits >> 40) % 676  # 26 * 26 harf çifti
+        numbers = (bits & 0xFFFFFFFFFF) % 100000000
+        return f"{_LETTERS[pair // 26]}{_LETTERS[pair % 26]}{numbers:08d}"
 
 
 class FastShipping(ShippingMethod):
@@ -62,13 +73,15 @@ class FastShipping(ShippingMethod):
     Strategy pattern'deki ConcreteStrategy rolünü üstlenir.
     """
     
-    def calculate_cost(self, order):
+    def calculate_cost(self, order, subtotal=None, item_count=None):
         """
         Hızlı kargo maliyetini hesaplar.
         Baz ücret + ürün başına ek ücret + toplam ağırlık ücreti.
         
         Args:
             order (Order): Sipariş nesnesi
+            subtotal (float, optional): Önceden hesaplanmış ara toplam
+            item_count (int, optional): Önceden hesaplanmış toplam ürün adedi
             
         Returns:
             float: Hesaplanan kargo maliyeti
@@ -76,17 +89,16 @@ class FastShipping(ShippingMethod):
         base_cost = 50  # Hızlı kargo için baz ücret
         per_item_cost = 5  # Ürün başına ek ücret
         
-        # Ürün sayısı bazlı ek ücret
-        item_count = sum(item.quantity for item in order.items)
+        if item_count is None:
+            item_count = order.get_total_quantity()
+        if subtotal is None:
+            subtotal = order.get_subtotal()
         
-        # Toplam maliyet
+        # Ürün sayısı bazlı ek ücret
         total_cost = base_cost + (per_item_cost * item_count)
         
-        # Toplam sipariş tutarı 1000 TL üzerindeyse indirim
-        if order.get_subtotal() > 1000:
-            total_cost *= 0.9  # %10 indirim
-            
-        return total_cost
+        # Toplam sipariş tutarı 1000 TL üzerindeyse %10 indirim
+        return total_cost * 0.9 if subtotal > 1000 else total_cost
     
     def estimate_delivery_time(self, order):
         """
@@ -99,7 +111,7 @@ class FastShipping(ShippingMethod):
             datetime: Tahmini teslimat tarihi
         """
         # Rastgele 1-2 gün teslimat süresi
-        days = random.randint(1, 2)
+        days = 1 + random.getrandbits(1)
         return datetime.now() + timedelta(days=days)
     
     def __str__(self):
@@ -113,24 +125,26 @@ class EconomicShipping(ShippingMethod):
     Strategy pattern'deki ConcreteStrategy rolünü üstlenir.
     """
     
-    def calculate_cost(self, order):
+    def calculate_cost(self, order, subtotal=None, item_count=None):
         """
         Ekonomik kargo maliyetini hesaplar.
         Düşük sabit ücret.
         
         Args:
             order (Order): Sipariş nesnesi
+            subtotal (float, optional): Önceden hesaplanmış ara toplam
+            item_count (int, optional): Önceden hesaplanmış toplam ürün adedi
             
         Returns:
             float: Hesaplanan kargo maliyeti
         """
         base_cost = 20  # Ekonomik kargo için baz ücret
         
+        if subtotal is None:
+            subtotal = order.get_subtotal()
+        
         # Toplam sipariş tutarı 500 TL üzerindeyse ücretsiz kargo
-        if order.get_subtotal() > 500:
-            return 0
-            
-        return base_cost
+        return 0 if subtotal > 500 else base_cost
     
     def estimate_delivery_time(self, order):
         """
@@ -143,7 +157,7 @@ class EconomicShipping(ShippingMethod):
             datetime: Tahmini teslimat tarihi
         """
         # Rastgele 3-5 gün teslimat süresi
-        days = random.randint(3, 5)
+        days = 3 + int(random.random() * 3)
         return datetime.now() + timedelta(days=days)
     
     def __str__(self):
@@ -157,13 +171,15 @@ class DroneShipping(ShippingMethod):
     Strategy pattern'deki ConcreteStrategy rolünü üstlenir.
     """
     
-    def calculate_cost(self, order):
+    def calculate_cost(self, order, subtotal=None, item_count=None):
         """
         Drone kargo maliyetini hesaplar.
         Yüksek sabit ücret + ağırlık bazlı ek ücret.
         
         Args:
             order (Order): Sipariş nesnesi
+            subtotal (float, optional): Önceden hesaplanmış ara toplam
+            item_count (int, optional): Önceden hesaplanmış toplam ürün adedi
             
         Returns:
             float: Hesaplanan kargo maliyeti
@@ -172,7 +188,8 @@ class DroneShipping(ShippingMethod):
         per_item_cost = 10  # Ürün başına ek ücret
         
         # Ürün sayısı bazlı ek ücret
-        item_count = sum(item.quantity for item in order.items)
+        if item_count is None:
+            item_count = order.get_total_quantity()
         
         # Toplam ücret
         return base_cost + (per_item_cost * item_count)
@@ -188,11 +205,11 @@ class DroneShipping(ShippingMethod):
             datetime: Tahmini teslimat tarihi
         """
         # Rastgele 0-1 gün teslimat süresi (0: bugün, 1: yarın)
-        days = random.randint(0, 1)
+        days = random.getrandbits(1)
         
         # Eğer bugünse, birkaç saat içinde
         if days == 0:
-            hours = random.randint(1, 6)
+            hours = 1 + int(random.random() * 6)
             return datetime.now() + timedelta(hours=hours)
         
         return datetime.now() + timedelta(days=days)
@@ -202,6 +219,12 @@ class DroneShipping(ShippingMethod):
         return "Drone ile Teslimat (Aynı gün veya ertesi gün)"
 
 
+# Paylaşılan strateji örnekleri (stratejiler durum tutmadığı için güvenlidir)
+FAST_SHIPPING = FastShipping()
+ECONOMIC_SHIPPING = EconomicShipping()
+DRONE_SHIPPING = DroneShipping()
+
+
 class ShippingFactory:
     """
     Kargo stratejisini belirleyen fabrika sınıfı.
@@ -219,19 +242,15 @@ class ShippingFactory:
         Returns:
             ShippingMethod: Seçilen kargo yöntemi
         """
-        # Toplam ürün miktarı
-        total_quantity = sum(item.quantity for item in order.items)
-        
         # Toplam sipariş tutarı
         subtotal = order.get_subtotal()
         
         # Stratejik seçim
         if subtotal > 2000:
             # Yüksek değerli siparişler için drone ile teslimat
-            return DroneShipping()
-        elif subtotal > 1000 or total_quantity <= 2:
+            return DRONE_SHIPPING
+        if subtotal > 1000 or order.get_total_quantity() <= 2:
             # Orta değerli siparişler veya az ürünlü siparişler için hızlı kargo
-            return FastShipping()
-        else:
-            # Diğer siparişler için ekonomik kargo
-            return EconomicShipping() 
\ No newline at end of file
+            return FAST_SHIPPING
+        # Diğer siparişler için ekonomik kargo
+        return ECONOMIC_SHIPPING 
\ No newline at end of file
@@ -6,6 +6,11 @@ Stok yönetimi için singleton sınıf.
 Singleton Design Pattern kullanılmıştır.
 """
 
+import threading
+
+# Singleton örneğinin oluşturulmasını korur
+_instance_lock = threading.Lock()
+
 class InventoryManager:
     """
     Stok yönetimi için singleton sınıf.
@@ -24,7 +29,9 @@ class InventoryManager:
             InventoryManager: Singleton örneği
         """
         if cls._instance is None:
-            cls._instance = cls()
+            with _instance_lock:
+                if cls._instance is None:
+                    cls._instance = cls()
         return cls._instance
     
     def __init__(self):
@@ -36,6 +43,13 @@ class InventoryManager:
             raise Exception("Bu sınıf bir Singleton'dır. get_instance() metodunu kullanın.")
             
         self.__products = {}  # Ürün ID'si -> Ürün nesnesi eşleşmesi
+        self.__by_category = {}  # Kategori -> (Ürün ID'si -> Ürün nesnesi) eşleşmesi
+        
+        # Yazma işlemleri kilit altında yapılır; okumalar değişmez
+        # anlık görüntülerden (tuple) kilitsiz olarak sunulur
+        self.__lock = threading.RLock()
+        self.__snapshot = None
+        self.__category_snapshots = {}
     
     def add_product(self, product):
         """
@@ -44,7 +58,17 @@ class InventoryManager:
         Args:
             product: Eklenecek veya güncellenecek ürün
         """
-        self.__products[product.product_id] = product
+        with self.__lock:
+            # Güncellenen ürün eski kategorisinden çıkarılır
+            old_product = self.__products.get(product.product_id)
+            if old_product is not None:
+                del self.__by_category[old_product.category][product.product_id]
+                self.__category_snapshots.pop(old_product.category, None)
+            
+            self.__products[product.product_id] = product
+            self.__by_category.setdefault(product.category, {})[product.product_id] = product
+            self.__category_snapshots.pop(product.category, None)
+            self.__snapshot = None
     
     def remove_product(self, product_id):
         """
@@ -56,10 +80,14 @@ class InventoryManager:
         Returns:
             bool: İşlem başarılıysa True, değilse False
         """
-        if product_id in self.__products:
-            del self.__products[product_id]
+        with self.__lock:
+            product = self.__products.pop(product_id, None)
+            if product is None:
+                return False
+            del self.__by_category[product.category][product_id]
+            self.__category_snapshots.pop(product.category, None)
+            self.__snapshot = None
             return True
-        return False
     
     def get_product(self, product_id):
         """
@@ -78,9 +106,15 @@ class InventoryManager:
         Tüm ürünleri döndürür.
         
         Returns:
-            list: Tüm ürün nesnelerinin listesi
-        """
-        return list(self.__products.values())
+            tuple: Tüm ürün nesneleri (değiştirilemez anlık görüntü)
+        """
+        snapshot = self.__snapshot
+        if snapshot is None:
+            with self.__lock:
+                snapshot = self.__snapshot
+                if snapshot is None:
+                    snapshot = self.__snapshot = tuple(self.__products.values())
+        return snapshot
     
     def get_products_by_category(self, category):
         """
@@ -90,9 +124,16 @@ class InventoryManager:
             category: ProductCategory enum değeri
             
         Returns:
-            list: Kategorideki ürün nesnelerinin listesi
-        """
-        return [product for product in self.__products.values() if product.category == category]
+            tuple: Kategorideki ürün nesneleri (değiştirilemez anlık görüntü)
+        """
+        snapshot = self.__category_snapshots.get(category)
+        if snapshot is None:
+            with self.__lock:
+                snapshot = self.__category_snapshots.get(category)
+                if snapshot is None:
+                    snapshot = tuple(self.__by_category.get(category, {}).values())
+                    self.__category_snapshots[category] = snapshot
+        return snapshot
     
     def check_stock(self, product_id, quantity):
         """
@@ -124,14 +165,49 @@ class InventoryManager:
         product = self.get_product(product_id)
         if product is None:
             return False
+        
+        with self.__lock:
+            if delta < 0 and product.stock_quantity < abs(delta):
+                # Eğer azalış miktarı mevcut stoktan fazlaysa hata
+                return False
+                
+            if delta < 0:
+                product.decrease_stock(abs(delta))
+            else:
+                product.increase_stock(delta)
             
-        if delta < 0 and product.stock_quantity < abs(delta):
-            # Eğer azalış miktarı mevcut stoktan fazlaysa hata
-            return False
-            
-        if delta < 0:
-            product.decrease_stock(abs(delta))
-        else:
-            product.increase_stock(delta)
+        return True
+    
+    def bulk_restock(self, quantities):
+        """
+        Birden fazla ürünün stoğunu tek bir kilit altında geri ekler.
+        İptal edilen siparişlerde ayrılan stokların iadesi için kullanılır.
+        
+        Args:
+            quantities: Ürün nesnesi -> iade edilecek miktar eşleşmesi
+        """
+        with self.__lock:
+            for product, quantity in quantities.items():
+                product.increase_stock(quantity)
+    
+    def reserve_order_items(self, order, products_with_quantities):
+        """
+        Ürünleri siparişe ekleyerek stoklarını tek bir kilit altında ayırır.
+        Ürünlerden biri için stok yetersizse o ana kadar ayrılan stoklar
+        aynı kilit altında geri iade edilir.
+        
+        Args:
+            order: Ürünlerin ekleneceği sipariş
+            products_with_quantities: (ürün, miktar) tuple'larının listesi
             
-        return True 
\ No newline at end of file
+        Returns:
+            bool: Tüm ürünler eklendiyse True, değilse False
+        """
+        with self.__lock:
+            reserved = {}  # Ürün -> stoktan düşülen toplam miktar
+            for product, quantity in products_with_quantities:
+                if not order.add_item(product, quantity):
+                    self.bulk_restock(reserved)
+                    return False
+                reserved[product] = reserved.get(product, 0) + quantity
+            return True 
\ No newline at end of file
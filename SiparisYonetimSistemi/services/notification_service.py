@@ -7,7 +7,30 @@ Observer Design Pattern kullanılmıştır.
 """
 
 from abc import ABC, abstractmethod
-from datetime import datetime
+import time
+
+# Son biçimlendirilen zaman damgası: (saniye, metin).
+# Tek bir tuple olarak saklandığı için okuma/yazma atomiktir.
+_timestamp_cache = (0, "")
+
+
+def _current_timestamp():
+    """
+    Bildirim zaman damgasını döndürür.
+    Aynı saniye içindeki çağrılar önceden biçimlendirilmiş metni kullanır.
+    
+    Returns:
+        str: "gg.aa.yyyy ss:dd:ss" biçiminde zaman damgası
+    """
+    global _timestamp_cache
+    second = int(time.time())
+    cached_second, cached_text = _timestamp_cache
+    if cached_second == second:
+        return cached_text
+    text = time.strftime("%d.%m.%Y %H:%M:%S", time.localtime(second))
+    _timestamp_cache = (second, text)
+    return text
+
 
 class NotificationObserver(ABC):
     """
@@ -92,7 +115,9 @@ class NotificationService:
         """
         Bildirim servisi oluşturur.
         """
-        self.__observers = []
+        self.__observers = []  # Sıralı dağıtım için liste
+        self.__observer_set = set()  # Hızlı üyelik kontrolü için küme
+        self.__observer_updates = ()  # Gözlemcilerin update metotları (dağıtım için)
         
         # Varsayılan gözlemcileri ekle
         self.add_observer(EmailNotification())
@@ -105,8 +130,10 @@ class NotificationService:
         Args:
             observer: Eklenecek gözlemci
         """
-        if observer not in self.__observers:
+        if observer not in self.__observer_set:
+            self.__observer_set.add(observer)
             self.__observers.append(observer)
+            self.__refresh_observer_updates()
     
     def remove_observer(self, observer):
         """
@@ -115,8 +142,16 @@ class NotificationService:
         Args:
             observer: Çıkarılacak gözlemci
         """
-        if observer in self.__observers:
+        if observer in self.__observer_set:
+            self.__observer_set.discard(observer)
             self.__observers.remove(observer)
+            self.__refresh_observer_updates()
+    
+    def __refresh_observer_updates(self):
+        """
+        Gözlemci listesi değiştiğinde update metotlarının önbelleğini yeniler.
+        """
+        self.__observer_updates = tuple(observer.update for observer in self.__observers)
     
     def send_order_notification(self, order, message):
         """
@@ -126,15 +161,28 @@ class NotificationService:
             order: Sipariş nesnesi
             message: Bildirim mesajı
         """
+        self.send_order_notifications_batch((order,), message)
+    
+    def send_order_notifications_batch(self, orders, message):
+        """
+        Birden fazla sipariş için aynı bildirimi gönderir.
+        Zaman damgası ve mesaj tüm siparişler için bir kez oluşturulur.
+        
+        Args:
+            orders: Sipariş nesnelerinin listesi
+            message: Bildirim mesajı
+        """
         # Bildirim gönderme zamanı
-        timestamp = datetime.now().strftime("%d.%m.%Y %H:%M:%S")
+        timestamp = _current_timestamp()
         
         # Bildirim mesajını genişlet
         full_message = f"[{timestamp}] {message}"
         
-        # Tüm gözlemcilere bildir
-        for observer in self.__observers:
-            observer.update(order, full_message)
+        # Her sipariş için tüm gözlemcilere bildir
+        updates = self.__observer_updates
+        for order in orders:
+            for update in updates:
+                update(order, full_message)
     
     def notify_all(self, order, status_message):
         """
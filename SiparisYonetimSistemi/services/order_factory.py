@@ -8,6 +8,7 @@ Factory Method Design Pattern kullanılmıştır.
 
 from models.order import Order, OrderStatus
 from models.shipping import ShippingFactory
+from services.inventory_manager import InventoryManager
 from services.notification_service import NotificationService
 
 class OrderFactory:
@@ -37,13 +38,9 @@ class OrderFactory:
         order = Order(customer)
         
         # Ürünleri siparişe ekle
-        for product, quantity in products_with_quantities:
-            if not order.add_item(product, quantity):
-                # Stok yeterli değilse siparişi iptal et
-                # Siparişi iptal ederken önceden eklenen ürünlerin stoklarını geri iade et
-                for item in order.items:
-                    item.product.increase_stock(item.quantity)
-                return None
+        # Stok yeterli değilse önceden eklenen ürünlerin stokları iade edilir ve sipariş iptal edilir
+        if not InventoryManager.get_instance().reserve_order_items(order, products_with_quantities):
+            return None
         
         # Sipariş notunu ayarla
         if notes:
@@ -77,15 +74,20 @@ class OrderFactory:
         Returns:
             bool: İşlem başarılıysa True, değilse False
         """
-        if not isinstance(new_status, OrderStatus):
+        if type(new_status) is not OrderStatus:
             return False
         
-        # Durum güncellemesi
+        # Durum değişmiyorsa yapılacak işlem ve gönderilecek bildirim yok
         old_status = order.status
+        if old_status is new_status:
+            return True
+        
+        # Durum güncellemesi
         order.status = new_status
+        is_shipped = new_status is OrderStatus.SHIPPED
         
         # Yeni duruma göre ek işlemler
-        if new_status == OrderStatus.SHIPPED:
+        if is_shipped:
             # Kargo yola çıktığında takip numarası oluştur
             if not order.tracking_number and order.shipping_method:
                 order.tracking_number = order.shipping_method.generate_tracking_number()
@@ -98,12 +100,13 @@ class OrderFactory:
         if self.__notification_service:
             message = f"Siparişinizin durumu '{old_status.value}' -> '{new_status.value}' olarak güncellendi."
             
-            if new_status == OrderStatus.SHIPPED and order.tracking_number:
-                message += f" Takip numaranız: {order.tracking_number}"
-                
-            if new_status == OrderStatus.SHIPPED and order.delivery_date:
-                delivery_str = order.delivery_date.strftime("%d.%m.%Y %H:%M")
-                message += f" Tahmini teslimat: {delivery_str}"
+            if is_shipped:
+                if order.tracking_number:
+                    message += f" Takip numaranız: {order.tracking_number}"
+                    
+                if order.delivery_date:
+                    delivery_str = order.delivery_date.strftime("%d.%m.%Y %H:%M")
+                    message += f" Tahmini teslimat: {delivery_str}"
                 
             self.__notification_service.send_order_notification(order, message)
         
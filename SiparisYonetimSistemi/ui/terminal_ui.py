@@ -6,11 +6,61 @@ Terminal kullanıcı arayüzü sınıfı
 """
 
 import os
+import sys
 import getpass
+import hashlib
+import hmac
+import itertools
 from models.product import ProductCategory
 from models.customer import Customer
 from models.order import OrderStatus
-from models.shipping import FastShipping, EconomicShipping, DroneShipping
+from models.shipping import FAST_SHIPPING, ECONOMIC_SHIPPING, DRONE_SHIPPING
+
+# Çalışma sırasında değişmeyen enum listeleri ve hazır menü metinleri
+_CATEGORY_TUPLE = tuple(ProductCategory)
+_STATUS_TUPLE = tuple(OrderStatus)
+_CATEGORY_MENU = "\n".join(f"{i}. {category.value}" for i, category in enumerate(_CATEGORY_TUPLE, 1))
+_STATUS_MENU = "\n".join(f"{i}. {status.value}" for i, status in enumerate(_STATUS_TUPLE, 1))
+
+# Kargo seçim menüsü ve seçim numarasına karşılık gelen kargo yöntemi
+# (0: Geri, 1: Otomatik seçim -> None)
+_SHIPPING_OPTIONS = (
+    "Otomatik seçim (en uygun kargo)",
+    "Hızlı Kargo (1-2 gün)",
+    "Ekonomik Kargo (3-5 gün)",
+    "Drone ile Teslimat (aynı gün)",
+)
+_SHIPPING_METHODS = (None, None, FAST_SHIPPING, ECONOMIC_SHIPPING, DRONE_SHIPPING)
+
+# Ekranı temizleyen ANSI kaçış dizisi (Windows dışındaki terminaller için)
+_CLEAR_SEQ = "\x1b[2J\x1b[H" if os.name != "nt" else None
+_HEADER_BAR = "=" * 60
+
+# Tüm şifrelere HMAC anahtarı olarak uygulanan gizli değer
+_PEPPER = os.environ.get("APP_PEPPER", "dev").encode("utf-8")
+_PBKDF2_ITERATIONS = 100000
+
+
+def _new_salt():
+    """Kullanıcıya özel rastgele 16 baytlık tuz üretir"""
+    return os.urandom(16)
+
+
+def _hash_password(password, salt):
+    """
+    Şifrenin tuzlu PBKDF2-HMAC-SHA256 özetini döndürür.
+    Şifre önce gizli değer (pepper) ile HMAC'lenir.
+    
+    Args:
+        password: Düz metin şifre
+        salt: Kullanıcıya özel tuz
+        
+    Returns:
+        bytes: 32 baytlık şifre özeti
+    """
+    peppered = hmac.new(_PEPPER, password.encode("utf-8"), hashlib.sha256).digest()
+    return hashlib.pbkdf2_hmac("sha256", peppered, salt, _PBKDF2_ITERATIONS)
+
 
 class TerminalUI:
     """
@@ -18,6 +68,9 @@ class TerminalUI:
     Kullanıcı ile etkileşim için basit bir CLI sağlar.
     """
     
+    # Yeni müşteri ID'leri için artan sayaç
+    _id_counter = itertools.count(1)
+    
     def __init__(self, inventory_manager, order_factory, notification_service):
         """
         Terminal arayüzü oluşturur.
@@ -32,17 +85,19 @@ class TerminalUI:
         self.__notification_service = notification_service
         self.__current_customer = None
         self.__shopping_cart = []  # (ürün, miktar) çiftleri
-        self.__registered_customers = {}  # email -> customer eşleşmesi
+        self.__cart_lines = []  # Sepet satırlarının hazır metinleri
+        # Sepet satırlarının ara toplamları. Satır çıkarıldığında toplam bu
+        # listeden yeniden hesaplanır; çıkarma işlemi yuvarlama hatası bırakır.
+        self.__cart_subtotals = []
+        self.__cart_total = 0  # Sepet toplamı
+        self.__registered_customers = {}  # email -> (customer, tuz, şifre özeti) eşleşmesi
     
     def clear_screen(self):
         """Terminali temizler"""
-        import os
-
-        def safe_clear():
-            try:
-                os.system("clear")  # Linux/macOS
-            except:
-                pass
+        if _CLEAR_SEQ:
+            sys.stdout.write(_CLEAR_SEQ)
+        else:
+            os.system("cls")  # Windows
 
     def display_header(self, title):
         """
@@ -52,9 +107,7 @@ class TerminalUI:
             title: Gösterilecek başlık
         """
         self.clear_screen()
-        print("\n" + "=" * 60)
-        print(f"{title}".center(60))
-        print("=" * 60 + "\n")
+        sys.stdout.write(f"\n{_HEADER_BAR}\n{title.center(60)}\n{_HEADER_BAR}\n\n")
     
     def display_menu(self, options):
         """
@@ -102,14 +155,33 @@ class TerminalUI:
         Returns:
             str: Kullanıcının girdiği şifre
         """
-
-
-        return input(message + ": ")  # Şifre görünür ama çalışır
+        return getpass.getpass(message + ": ")
 
     def wait_for_enter(self):
         """Kullanıcının Enter tuşuna basmasını bekler"""
         input("\nDevam etmek için Enter tuşuna basın...")
     
+    def add_to_cart(self, product, quantity):
+        """
+        Sepete ürün ekler ve sepet toplamını günceller.
+        
+        Args:
+            product: Eklenecek ürün
+            quantity: Ürün miktarı
+        """
+        subtotal = product.price * quantity
+        self.__shopping_cart.append((product, quantity))
+        self.__cart_lines.append(f"{product.name} - {quantity} adet x {product.price} TL = {subtotal} TL")
+        self.__cart_subtotals.append(subtotal)
+        self.__cart_total += subtotal
+    
+    def clear_cart(self):
+        """Sepeti ve sepet toplamını sıfırlar"""
+        self.__shopping_cart = []
+        self.__cart_lines = []
+        self.__cart_subtotals = []
+        self.__cart_total = 0
+    
     def register_customer(self):
         """
         Yeni müşteri kaydı oluşturur.
@@ -119,7 +191,7 @@ class TerminalUI:
         """
         self.display_header("MÜŞTERİ KAYDI")
         
-        customer_id = f"C{str(id(self))[-4:]}"  # Benzersiz ID oluştur
+        customer_id = f"C{next(TerminalUI._id_counter):04d}"  # Benzersiz ID oluştur
         name = self.prompt("Adınız ve soyadınız")
         
         while True:
@@ -150,9 +222,9 @@ class TerminalUI:
             phone = None
         
         customer = Customer(customer_id, name, email, address, phone)
-        # Şifreyi burada bir sözlükte saklamak basit bir çözüm
-        # Gerçek bir uygulamada şifreler hashlenerek saklanmalıdır
-        self.__registered_customers[email] = {"customer": customer, "password": password}
+        # Şifre düz metin yerine kullanıcıya özel tuzla özetlenerek saklanır
+        salt = _new_salt()
+        self.__registered_customers[email] = (customer, salt, _hash_password(password, salt))
         
         print(f"\nHoş Geldiniz, {name}! Müşteri kaydınız oluşturuldu.")
         
@@ -172,8 +244,8 @@ class TerminalUI:
         password = self.prompt_password("Şifreniz")
         
         # Kullanıcı kayıtlı mı ve şifre doğru mu kontrol et
-        if email in self.__registered_customers and self.__registered_customers[email]["password"] == password:
-            customer = self.__registered_customers[email]["customer"]
+        customer, salt, stored_hash = self.__registered_customers.get(email, (None, None, None))
+        if customer is not None and hmac.compare_digest(stored_hash, _hash_password(password, salt)):
             print(f"\nHoş Geldiniz, {customer.name}!")
             self.wait_for_enter()
             return customer
@@ -189,7 +261,7 @@ class TerminalUI:
         if self.__current_customer:
             name = self.__current_customer.name
             self.__current_customer = None
-            self.__shopping_cart = []  # Sepeti temizle
+            self.clear_cart()  # Sepeti temizle
             print(f"\n{name}, oturumunuz başarıyla kapatıldı.")
             self.wait_for_enter()
     
@@ -205,11 +277,12 @@ class TerminalUI:
             print("Gösterilecek ürün bulunamadı.")
             return
         
-        for i, product in enumerate(products, 1):
-            if show_details:
-                print(f"{i}. {product}")
-            else:
-                print(f"{i}. {product.name} - {product.price} TL")
+        # Tüm liste tek seferde yazdırılır
+        if show_details:
+            lines = [f"{i}. {product}" for i, product in enumerate(products, 1)]
+        else:
+            lines = [f"{i}. {product.name} - {product.price} TL" for i, product in enumerate(products, 1)]
+        sys.stdout.write("\n".join(lines) + "\n")
     
     def display_categories(self):
         """
@@ -220,9 +293,8 @@ class TerminalUI:
         """
         self.display_header("KATEGORİLER")
         
-        categories = list(ProductCategory)
-        for i, category in enumerate(categories, 1):
-            print(f"{i}. {category.value}")
+        categories = _CATEGORY_TUPLE
+        print(_CATEGORY_MENU)
         
         print("\n0. Tümünü Göster")
         
@@ -310,14 +382,10 @@ class TerminalUI:
                 self.wait_for_enter()
                 return False
             
-            # Sepet içeriğini göster
-            total = 0
-            for i, (product, quantity) in enumerate(self.__shopping_cart, 1):
-                subtotal = product.price * quantity
-                total += subtotal
-                print(f"{i}. {product.name} - {quantity} adet x {product.price} TL = {subtotal} TL")
-            
-            print(f"\nToplam: {total} TL")
+            # Sepet içeriğini göster (satırlar ve toplam sepet değiştikçe güncellenir)
+            lines = [f"{i}. {line}" for i, line in enumerate(self.__cart_lines, 1)]
+            lines.append(f"\nToplam: {self.__cart_total} TL")
+            sys.stdout.write("\n".join(lines) + "\n")
             
             # Seçenekleri göster
             options = ["Alışverişi tamamla", "Ürün çıkar", "Sepeti boşalt"]
@@ -330,7 +398,7 @@ class TerminalUI:
             elif choice == 2:  # Ürün çıkar
                 self.remove_from_cart()
             elif choice == 3:  # Sepeti boşalt
-                self.__shopping_cart = []
+                self.clear_cart()
                 print("Sepet boşaltıldı.")
                 self.wait_for_enter()
     
@@ -350,6 +418,9 @@ class TerminalUI:
                     return
                 elif 1 <= choice <= len(self.__shopping_cart):
                     self.__shopping_cart.pop(choice - 1)
+                    self.__cart_lines.pop(choice - 1)
+                    self.__cart_subtotals.pop(choice - 1)
+                    self.__cart_total = sum(self.__cart_subtotals)
                     print("Ürün sepetten çıkarıldı.")
                     self.wait_for_enter()
                     return
@@ -366,23 +437,8 @@ class TerminalUI:
         """
         self.display_header("KARGO YÖNTEMİ SEÇİMİ")
         
-        options = [
-            "Otomatik seçim (en uygun kargo)",
-            "Hızlı Kargo (1-2 gün)",
-            "Ekonomik Kargo (3-5 gün)",
-            "Drone ile Teslimat (aynı gün)"
-        ]
-        
-        choice = self.display_menu(options)
-        
-        if choice == 0 or choice == 1:
-            return None  # Otomatik seçim
-        elif choice == 2:
-            return FastShipping()
-        elif choice == 3:
-            return EconomicShipping()
-        elif choice == 4:
-            return DroneShipping()
+        choice = self.display_menu(_SHIPPING_OPTIONS)
+        return _SHIPPING_METHODS[choice]
     
     def complete_order(self):
         """
@@ -434,7 +490,7 @@ class TerminalUI:
             if order.shipping_method:
                 print(f"Kargo: {order.shipping_method}")
                 
-            self.__shopping_cart = []  # Sepeti temizle
+            self.clear_cart()  # Sepeti temizle
             self.wait_for_enter()
             return True
         else:
@@ -488,29 +544,32 @@ class TerminalUI:
         """
         self.display_header(f"SİPARİŞ #{order.order_id} DETAYLARI")
         
-        print(f"Durum: {order.status.value}")
-        print(f"Tarih: {order.create_date.strftime('%d.%m.%Y %H:%M')}")
-        print(f"Müşteri: {order.customer.name}\n")
-        
-        print("ÜRÜNLER:")
-        for item in order.items:
-            print(f"• {item}")
+        # Ekran içeriği satır satır toplanıp tek seferde yazdırılır
+        lines = [
+            f"Durum: {order.status.value}",
+            f"Tarih: {order.create_date.strftime('%d.%m.%Y %H:%M')}",
+            f"Müşteri: {order.customer.name}\n",
+            "ÜRÜNLER:",
+        ]
+        lines.extend(f"• {item}" for item in order.items)
         
-        print(f"\nToplam (kargo hariç): {order.get_subtotal()} TL")
+        lines.append(f"\nToplam (kargo hariç): {order.get_subtotal()} TL")
         
         if order.shipping_method:
-            print(f"Kargo: {order.shipping_method} - {order.shipping_cost} TL")
+            lines.append(f"Kargo: {order.shipping_method} - {order.shipping_cost} TL")
             
             if order.tracking_number:
-                print(f"Takip No: {order.tracking_number}")
+                lines.append(f"Takip No: {order.tracking_number}")
                 
             if order.delivery_date:
-                print(f"Tahmini Teslim: {order.delivery_date.strftime('%d.%m.%Y %H:%M')}")
+                lines.append(f"Tahmini Teslim: {order.delivery_date.strftime('%d.%m.%Y %H:%M')}")
         
-        print(f"TOPLAM: {order.get_total()} TL")
+        lines.append(f"TOPLAM: {order.get_total()} TL")
         
         if order.notes:
-            print(f"\nSipariş Notu: {order.notes}")
+            lines.append(f"\nSipariş Notu: {order.notes}")
+        
+        sys.stdout.write("\n".join(lines) + "\n")
         
         # Admin için ek seçenekler (gösterim amaçlı)
         print("\n--- Admin Seçenekleri ---")
@@ -529,14 +588,11 @@ class TerminalUI:
         """
         self.display_header(f"SİPARİŞ #{order.order_id} DURUMU GÜNCELLE")
         
-        statuses = list(OrderStatus)
-        current_index = statuses.index(order.status)
+        statuses = _STATUS_TUPLE
         
         print(f"Mevcut Durum: {order.status.value}")
         print("\nYeni durum seçin:")
-        
-        for i, status in enumerate(statuses, 1):
-            print(f"{i}. {status.value}")
+        print(_STATUS_MENU)
         
         print("\n0. İptal")
         
@@ -582,9 +638,10 @@ class TerminalUI:
             
         print(f"Toplam {len(self.__registered_customers)} kayıtlı müşteri:\n")
         
-        for email, data in self.__registered_customers.items():
-            customer = data["customer"]
-            print(f"• {customer.name} ({email})")
+        sys.stdout.write("\n".join(
+            f"• {customer.name} ({email})"
+            for email, (customer, _, _) in self.__registered_customers.items()
+        ) + "\n")
             
         self.wait_for_enter()
     
@@ -650,7 +707,7 @@ class TerminalUI:
             elif choice == 1:  # Ürünlere Göz At
                 product_info = self.browse_products()
                 if product_info:
-                    self.__shopping_cart.append(product_info)
+                    self.add_to_cart(*product_info)
                     print(f"\n{product_info[0].name} sepete eklendi.")
                     
                     if self.prompt("Sepeti görüntülemek ister misiniz? (e/h)").lower() == 'e':
@@ -676,6 +733,7 @@ class TerminalUI:
         """Uygulamayı başlatır"""
         # Demo için örnek müşteri ekleme
         demo_customer = Customer("C1234", "Demo Kullanıcı", "demo@example.com", "Demo Adres", "5551234567")
-        self.__registered_customers["demo@example.com"] = {"customer": demo_customer, "password": "123456"}
+        demo_salt = _new_salt()
+        self.__registered_customers["demo@example.com"] = (demo_customer, demo_salt, _hash_password("123456", demo_salt))
         
         self.main_menu()
\ No newline at end of file